@@ -36,15 +36,17 @@ The generated current_step.md follows this section order:
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
 import logging
 import os
+import shutil
 import sys
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .config import ReporterConfig
 from .context_builder import ContextBuilder
-from .openai_client import OpenAIClient
 
 
 # The fixed block of instructions that must always be present in the
@@ -92,18 +94,113 @@ PATCH_INSTRUCTIONS = (
     "]"
 )
 
+# Fixed prompt fragments, built once at import time instead of on every
+# call to `iter_prompt_chunks`.  Sections are separated by `_PART_SEP` and
+# wrapped as `_SECTION_OPEN + title + body + _SECTION_CLOSE_FMT`.
+_PART_SEP = "\n\n"
+_SECTION_OPEN = "\n\n\n\n ---\n ---\n# "
+_SECTION_CLOSE_FMT = "\n\n# End of {name}\n ---\n ---\n"
+
+_SYSTEM_INSTRUCTIONS_BLOCK = (
+    "# System instructions\n"
+    + PATCH_INSTRUCTIONS.strip()
+    + _SECTION_CLOSE_FMT.format(name="system instructions")
+)
+_STRUCTURE_OPEN = "\n\n\n\n" + _SECTION_OPEN + "Current codebase structure\n"
+_STRUCTURE_CLOSE = "\n\n# End of current codebase structure\n ---\n"
+_FILES_HEADER = "\n\n ---\n# Current codebase files\n"
+_FILES_FOOTER = "# End of current codebase files\n ---\n ---"
+
+
+def _escape_braces(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _section_template(title: str, field_name: str) -> str:
+    """Return a `str.format` template wrapping `{field_name}` in the markers for `title`."""
+    return (
+        _escape_braces(_SECTION_OPEN + title + "\n")
+        + "{" + field_name + "}"
+        + _escape_braces(_SECTION_CLOSE_FMT.format(name=title.lower()))
+    )
+
+
+def _head_template(include_patch_instructions: bool, has_system_description: bool) -> str:
+    """Return the template for every section before the codebase files."""
+    parts: List[str] = []
+    if include_patch_instructions:
+        parts.append(_escape_braces(_SYSTEM_INSTRUCTIONS_BLOCK + _PART_SEP))
+    parts.append(_section_template("User instructions", "user"))
+    if has_system_description:
+        parts.append(_PART_SEP + _section_template("System general description", "system"))
+    parts.append(_escape_braces(_PART_SEP + _STRUCTURE_OPEN) + "{tree}" + _escape_braces(_STRUCTURE_CLOSE))
+    return "".join(parts)
+
+
+# The prompt head specialized per (include_patch_instructions,
+# has_system_description), so assembling it is one `str.format` call.
+_HEAD_TEMPLATES: Dict[Tuple[bool, bool], str] = {
+    (patch, system): _head_template(patch, system)
+    for patch in (True, False)
+    for system in (True, False)
+}
+
 
 def read_optional_file(path: Optional[Path]) -> str:
     """Return the contents of `path` if it exists, else an empty string."""
     if path is None:
         return ""
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return f.read().strip()
+        return path.read_text(encoding="utf-8").strip()
     except Exception as exc:
         return f"[Error reading {path}: {exc}]"
 
 
+def _format_file_block(fe: ContextBuilder.FileEntry) -> str:
+    """Return the delimited prompt block for a single file entry.
+
+    The block depends only on the entry's path, content and line count;
+    the trailing blank lines space out consecutive files.
+    """
+    return (
+        f"--- # inicio archivo {fe.rel_path}; LOC 0 ---\n"
+        f"{fe.content}\n"
+        f"--- # fin archivo {fe.rel_path}; LOC {fe.loc_total + 1} --- \n\n\n\n\n\n"
+    )
+
+
+def iter_prompt_chunks(
+    user_instructions: str,
+    system_description: str,
+    file_tree: str,
+    file_entries: List[ContextBuilder.FileEntry],
+    summaries: str,  # kept for CLI compatibility; not included in output per new spec
+    include_patch_instructions: bool = True,
+) -> Iterator[str]:
+    """Yield the final prompt piece by piece, in output order.
+
+    File contents are yielded as-is rather than copied into a single
+    buffer, so callers can stream the prompt to disk without holding a
+    second full copy in memory.  Concatenating every chunk yields exactly
+    the string returned by `build_prompt`.
+    """
+    # 1) System instructions (PatchPilot) first, unless explicitly disabled,
+    # 2) user instructions, 3) optional system general description and
+    # 4) current codebase structure, filled into a precomputed template.
+    yield _HEAD_TEMPLATES[(include_patch_instructions, bool(system_description))].format(
+        user=user_instructions.strip(),
+        system=system_description.strip(),
+        tree=file_tree,
+    )
+    # 5) Current codebase files
+    if file_entries:
+        yield _PART_SEP
+        yield _FILES_HEADER
+        yield from map(_format_file_block, file_entries)
+        yield _FILES_FOOTER
+    # Per new spec, no "summaries" or legacy section names here.
+
+
 def build_prompt(
     user_instructions: str,
     system_description: str,
@@ -113,33 +210,69 @@ def build_prompt(
     include_patch_instructions: bool = True,
 ) -> str:
     """Assemble the final prompt string from its constituent parts."""
-    parts: List[str] = []
-    # 1) System instructions (PatchPilot) first, unless explicitly disabled
-    if include_patch_instructions:
-        parts.append(
-            "# System instructions\n"
-            + PATCH_INSTRUCTIONS.strip()
-            + "\n\n# End of system instructions\n ---\n ---\n"
+    return "".join(
+        iter_prompt_chunks(
+            user_instructions=user_instructions,
+            system_description=system_description,
+            file_tree=file_tree,
+            file_entries=file_entries,
+            summaries=summaries,
+            include_patch_instructions=include_patch_instructions,
         )
-    # 2) User instructions
-    parts.append("\n\n\n\n ---\n ---\n# User instructions\n" + user_instructions.strip() + "\n\n# End of user instructions\n ---\n ---\n")
-    # 3) System general description (optional)
-    if system_description:
-        parts.append("\n\n\n\n ---\n ---\n# System general description\n" + system_description.strip() + "\n\n# End of system general description\n ---\n ---\n")
-    # 4) Current codebase structure
-    parts.append("\n\n\n\n\n\n\n\n ---\n ---\n# Current codebase structure\n" + file_tree + "\n\n# End of current codebase structure\n ---\n")
-    # 5) Current codebase files
-    if file_entries:
-        fc_lines: List[str] = ["\n\n ---\n# Current codebase files"]
-        for fe in file_entries:
-            fc_lines.append(f"--- # inicio archivo {fe.rel_path}; LOC 0 ---")
-            fc_lines.append(fe.content)
-            fc_lines.append(f"--- # fin archivo {fe.rel_path}; LOC {fe.loc_total + 1} --- \n\n\n\n")
-            fc_lines.append("")  # spacer between files
-        fc_lines.append("# End of current codebase files\n ---\n ---\n")
-        parts.append("\n".join(fc_lines).rstrip())
-    # Per new spec, no "summaries" or legacy section names here.
-    return "\n\n".join(parts)
+    )
+
+
+def _tmp_path_for(path: Path) -> Path:
+    """Return the temporary sibling used while atomically replacing `path`."""
+    return path.with_name(path.name + ".tmp")
+
+
+def _atomic_write(path: Path, chunks: Iterable[str]) -> None:
+    """Write `chunks` to `path` so readers never observe a partial file.
+
+    The text goes to a temporary sibling first and is then renamed over
+    `path` with `os.replace`, which is atomic on the same filesystem.
+    """
+    tmp = _tmp_path_for(path)
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            f.writelines(chunks)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=1024)
+def _name_for(n: int) -> str:
+    """Return the alphabetical diff file name for index `n`."""
+    # 0->a, 1->b, ..., 25->z, 26->aa, 27->ab, ...
+    s = []
+    while True:
+        s.append(chr(ord('a') + (n % 26)))
+        n = n // 26 - 1
+        if n < 0: break
+    return "".join(reversed(s)) + ".diff"
+
+
+def _next_alpha_diff_path(base_dir: Path) -> Path:
+    """Pick the first free alphabetical diff name in `base_dir`.
+
+    Names go a.diff, b.diff, ..., z.diff, aa.diff, ab.diff, ...  The
+    directory is listed once up front instead of probing each candidate
+    with a separate stat.
+    """
+    try:
+        with os.scandir(base_dir) as it:
+            taken = {entry.name for entry in it if entry.name.endswith(".diff")}
+    except OSError:
+        taken = set()
+    i = 0
+    name = _name_for(i)
+    while name in taken:
+        i += 1
+        name = _name_for(i)
+    return base_dir / name
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -227,6 +360,16 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=os.environ.get("REPORTER_LOGLEVEL", "INFO").upper(),
         help="Logging verbosity (default from env REPORTER_LOGLEVEL or INFO).",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="With --call-api, receive the response as a stream over one connection instead of polling for it.",
+    )
+    parser.add_argument(
+        "--editor",
+        action="store_true",
+        help="Pick folders and files from a checklist opened in $VISUAL/$EDITOR instead of answering one Y/N prompt per item.",
+    )
     parser.add_argument(
         "--no-diff",
         action="store_true",
@@ -259,7 +402,6 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     # Load configuration
     config = ReporterConfig.load(root)
-    logger.info("Loaded configuration from %s", config.reporter_config_path or "defaults")
 
     # Determine message file if not provided
     message_path = args.message
@@ -280,23 +422,33 @@ def main(argv: Optional[List[str]] = None) -> int:
     system_desc = read_optional_file(system_path) if system_path else ""
     summaries_text = read_optional_file(summaries_path) if summaries_path else ""
 
-    # Execution context diagnostics
-    logger.info(
-        "Execution context: cwd=%s | root=%s | message=%s | system_description=%s | output=%s | call_api=%s",
-        Path.cwd(),
-        root,
-        message_path.resolve() if message_path else None,
-        system_path.resolve() if system_path else None,
-        args.output.resolve(),
-        args.call_api,
-    )
+    # Execution context diagnostics, emitted as a single record.  The guard
+    # skips the resolve() calls entirely when INFO is disabled.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Execution context:\n"
+            "  cwd=%s\n"
+            "  root=%s\n"
+            "  config=%s\n"
+            "  message=%s\n"
+            "  system_description=%s\n"
+            "  output=%s\n"
+            "  call_api=%s",
+            Path.cwd(),
+            root,
+            config.reporter_config_path or "defaults",
+            message_path.resolve() if message_path else None,
+            system_path.resolve() if system_path else None,
+            args.output.resolve(),
+            args.call_api,
+        )
 
     # Build context
     # Interactive collection based on current working directory and persisted decisions
     builder = ContextBuilder(Path.cwd(), config.include_exclude)
-    file_tree, file_entries = builder.collect_interactive()
+    file_tree, file_entries = builder.collect_interactive(use_editor=args.editor)
 
-    prompt = build_prompt(
+    prompt_parts = dict(
         user_instructions=user_instructions,
         system_description=system_desc,
         file_tree=file_tree,
@@ -304,11 +456,17 @@ def main(argv: Optional[List[str]] = None) -> int:
         summaries=summaries_text,
         include_patch_instructions=not args.no_diff,
     )
+    prompt_chunks: Iterable[str] = iter_prompt_chunks(**prompt_parts)
+    # The API call needs the whole prompt as one string, so only materialize it
+    # in that case; otherwise chunks are streamed straight to disk.
+    prompt = ""
+    if args.call_api:
+        prompt = "".join(prompt_chunks)
+        prompt_chunks = (prompt,)
 
     # Write prompt to output file
     try:
-        with args.output.open("w", encoding="utf-8") as f:
-            f.write(prompt)
+        _atomic_write(args.output, prompt_chunks)
         logger.info("Prompt written to %s", args.output)
     except Exception as exc:
         logger.error("Failed to write prompt file: %s", exc)
@@ -316,11 +474,12 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     # Optionally call the API
     if args.call_api:
-        if args.no_diff:
-            logger.info("Mode: --no-diff enabled → text response (no unified diff).")
-        else:
-            logger.info("Mode: diff (default) → expecting unified diff output.")
-        logger.info("API policy: forcing model to GPT-5 with reasoning_effort=high and verbosity=high.")
+        logger.info(
+            "Mode: %s\nAPI policy: forcing model to GPT-5 with reasoning_effort=high and verbosity=high.",
+            "--no-diff enabled → text response (no unified diff)."
+            if args.no_diff
+            else "diff (default) → expecting unified diff output.",
+        )
         logger.debug("Requested CLI model was '%s' (will be overridden).", args.model)
         api_key = config.openai_api_key
         if not api_key:
@@ -329,6 +488,9 @@ def main(argv: Optional[List[str]] = None) -> int:
         #
         # Enforce GPT-5 + high reasoning effort + high verbosity when calling the API.
         #
+        # Imported lazily: openai/tiktoken are slow to import and only needed here.
+        from .openai_client import OpenAIClient
+
         forced_model = "gpt-5"
         if args.model != forced_model:
             logger.info("Overriding requested model '%s' → '%s' due to --call-api policy.", args.model, forced_model)
@@ -351,9 +513,16 @@ def main(argv: Optional[List[str]] = None) -> int:
             " Do not explain the diff; just output the diff itself."
             )
         # ---- Token accounting & guardrails ----
-        # Exact model-aware tokenization via tiktoken (encoding_for_model('gpt-5') if available).
+        # Model-aware estimate via tiktoken (encoding_for_model('gpt-5') if available)
+        # that drives the --input-token-limit guard below.  The prompt is
+        # tokenized chunk by chunk (per-file blocks are cached across runs by
+        # content hash) instead of building yet another full copy of it, so
+        # the sum can differ from a whole-prompt count by about a token per
+        # chunk boundary, usually as a slight over-count.
         try:
-            input_tokens = client.estimate_tokens(instructions + "\n" + prompt)
+            input_tokens = client.estimate_tokens_stream(
+                itertools.chain((instructions, "\n"), iter_prompt_chunks(**prompt_parts))
+            )
         except Exception as exc:
             logger.warning("Failed to estimate tokens precisely (%s). Falling back to heuristic.", exc)
             input_tokens = max(1, (len(instructions) + len(prompt)) // 4)
@@ -404,6 +573,7 @@ def main(argv: Optional[List[str]] = None) -> int:
                 temperature=0,
                 reasoning_effort="high",
                 verbosity="high",
+                stream=args.stream,
             )
         except Exception as exc:
             logger.error("API call failed: %s", exc)
@@ -431,30 +601,13 @@ def main(argv: Optional[List[str]] = None) -> int:
         # Determine output folder (same as current_step.md)
         output_dir = args.output.parent if args.output else Path(".")
 
-        # Helper: pick next free alphabetical diff name: a.diff, b.diff, ..., z.diff, aa.diff, ab.diff, ...
-        def _next_alpha_diff_path(base_dir: Path) -> Path:
-            def _name_for(n: int) -> str:
-                # 0->a, 1->b, ..., 25->z, 26->aa, 27->ab, ...
-                s = []
-                n0 = n
-                while True:
-                    s.append(chr(ord('a') + (n % 26)))
-                    n = n // 26 - 1
-                    if n < 0: break
-                return "".join(reversed(s)) + ".diff"
-            i = 0
-            while True:
-                candidate = base_dir / _name_for(i)
-                if not candidate.exists():
-                    return candidate
-                i += 1
         if args.no_diff:
             # Plain text response output
             resp_md = output_dir / "response.md"
             try:
-                with resp_md.open("w", encoding="utf-8") as f:
-                    f.write(output_text or "")
-                logger.info("Text response written to %s", resp_md.resolve())
+                _atomic_write(resp_md, (output_text or "",))
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Text response written to %s", resp_md.resolve())
             except Exception as exc:
                 logger.error("Failed to write text response file: %s", exc)
                 return 1
@@ -465,11 +618,24 @@ def main(argv: Optional[List[str]] = None) -> int:
             # 2) Also write to the first free alphabetical file: a.diff, b.diff, c.diff, ...
             diff_alpha = _next_alpha_diff_path(output_dir)
             try:
-                with diff_md.open("w", encoding="utf-8") as f:
-                    f.write(output_text or "")
-                with diff_alpha.open("w", encoding="utf-8") as f:
-                    f.write(output_text or "")
-                logger.info("Diff written to %s and %s", diff_md.resolve(), diff_alpha.resolve())
+                # Write the bytes once to the fresh alphabetical file and make
+                # current_diff.md a hard link to it.  The link is created under
+                # a temporary name and renamed over current_diff.md, so the
+                # previous current_diff.md (possibly a link to an older diff)
+                # is swapped out atomically instead of overwritten in place.
+                _atomic_write(diff_alpha, (output_text or "",))
+                tmp_md = _tmp_path_for(diff_md)
+                tmp_md.unlink(missing_ok=True)
+                try:
+                    os.link(diff_alpha, tmp_md)
+                except OSError:
+                    # No hard-link support (e.g. some network or FAT filesystems).
+                    shutil.copyfile(diff_alpha, tmp_md)
+                os.replace(tmp_md, diff_md)
+                if logger.isEnabledFor(logging.INFO):
+                    # Both files live in output_dir; resolve it once for display.
+                    shown_dir = output_dir.resolve()
+                    logger.info("Diff written to %s and %s", shown_dir / diff_md.name, shown_dir / diff_alpha.name)
             except Exception as exc:
                 logger.error("Failed to write diff files: %s", exc)
                 return 1
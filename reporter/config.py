@@ -19,11 +19,95 @@ Defaults are conservative and exclude common generated artifacts
 
 from __future__ import annotations
 
+import fnmatch
+import hashlib
 import json
 import os
+import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+from .token_cache import default_cache_dir
+
+
+# fnmatch.fnmatch compares os.path.normcase'd strings, which is
+# case-insensitive on Windows.  Mirror that when compiling patterns.
+_GLOB_FLAGS = re.IGNORECASE if os.path.normcase("A") != "A" else 0
+_GLOB_MAGIC = frozenset("*?[")
+# Final pattern characters that can match the trailing '/' of a directory path.
+_DIR_MATCHING_TAILS = frozenset("/*?]")
+# Pattern lists at least this long keep their fused regex in the disk cache.
+_GLOB_CACHE_MIN_PATTERNS = 32
+
+
+def _dir_name_of(pattern: str) -> Optional[str]:
+    """Return NAME if `pattern` is exactly '**/NAME/**' with a literal NAME."""
+    if not (pattern.startswith("**/") and pattern.endswith("/**") and len(pattern) > 6):
+        return None
+    name = pattern[3:-3]
+    if "/" in name or _GLOB_MAGIC.intersection(name):
+        return None
+    return name
+
+
+def _translate_unanchored(pattern: str) -> str:
+    """Return fnmatch.translate(pattern) without its trailing end anchor."""
+    translated = fnmatch.translate(pattern)
+    # Python <= 3.13 ends translations with \Z, 3.14+ with \z.
+    if translated.endswith(("\\Z", "\\z")):
+        translated = translated[:-2]
+    return translated
+
+
+def _glob_cache_path(patterns: List[str]) -> Path:
+    """Return the on-disk location of the fused regex for `patterns`."""
+    # fnmatch.translate output differs between Python versions, so the
+    # interpreter version is part of the key.
+    key = json.dumps([sys.version_info[:2], patterns])
+    digest = hashlib.sha1(key.encode("utf-8", "surrogatepass")).hexdigest()
+    return default_cache_dir() / "globs" / f"{digest}.re"
+
+
+def _fused_glob_source(patterns: List[str]) -> str:
+    """Return the anchored alternation of the translated `patterns`.
+
+    Large pattern lists are translated once and kept in zoro's cache
+    directory keyed by a hash of the list, so later runs only read the
+    regex text back.  Small lists are cheaper to translate than to look
+    up.  Cache errors are ignored.
+    """
+    cache_path = _glob_cache_path(patterns) if len(patterns) >= _GLOB_CACHE_MIN_PATTERNS else None
+    if cache_path is not None:
+        try:
+            return cache_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeError):
+            pass
+    source = "(?:" + "|".join(_translate_unanchored(p) for p in patterns) + ")\\Z"
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(source, encoding="utf-8")
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass
+    return source
+
+
+def _compile_globs(patterns: Iterable[str]) -> Optional[Pattern[str]]:
+    """Fuse glob patterns into one regex equivalent to any(fnmatch(...)).
+
+    Each translated pattern loses its own end anchor and the alternation is
+    anchored once, so a path is tested in a single regex pass.  Returns
+    None when there are no patterns, since an empty alternation would
+    match every path.
+    """
+    patterns = list(patterns)
+    if not patterns:
+        return None
+    return re.compile(_fused_glob_source(patterns), _GLOB_FLAGS)
 
 
 @dataclass
@@ -79,6 +163,65 @@ class IncludeExcludeConfig:
     max_file_lines: int = 400
     max_total_characters: int = 0
 
+    def __post_init__(self) -> None:
+        # Compile the pattern lists once; matching a path is then a single
+        # regex call instead of one fnmatch call per pattern.  The lists
+        # are treated as read-only after construction.
+        self._exclude_re = _compile_globs(self.exclude_patterns)
+        self._include_re = _compile_globs(self.include_patterns)
+        # Names NAME from patterns shaped exactly like '**/NAME/**'.  Any
+        # directory with such a name below the project root is excluded,
+        # which lets a walker prune it without running the regex.
+        dir_names = {p: _dir_name_of(p) for p in self.exclude_patterns}
+        self._excluded_dir_names = frozenset(n for n in dir_names.values() if n)
+        # Remaining patterns that can match a directory path.  Directory
+        # paths end with '/', which a pattern can only match if it ends with
+        # '/' or a wildcard; literal names like 'Thumbs.db' never can.
+        self._dir_exclude_re = _compile_globs(
+            p for p, name in dir_names.items() if not name and p[-1:] in _DIR_MATCHING_TAILS
+        )
+
+    @property
+    def excluded_dir_names(self) -> FrozenSet[str]:
+        """Directory names excluded at any depth below the project root.
+
+        Derived from '**/NAME/**' patterns.  These do not match a directory
+        sitting directly in the root, so callers must only use this set for
+        nested directories.
+        """
+        return self._excluded_dir_names
+
+    @property
+    def has_dir_exclude_globs(self) -> bool:
+        """True if `matches_exclude_dir` can ever return True."""
+        return self._dir_exclude_re is not None
+
+    def matches_exclude_dir(self, dir_rel: str) -> bool:
+        """Return True if directory `dir_rel` (with trailing '/') is excluded.
+
+        Only valid inside a top-down walk that already prunes
+        `excluded_dir_names` below the root: '**/NAME/**' patterns are left
+        to that check and are not evaluated here.
+        """
+        return self._dir_exclude_re is not None and self._dir_exclude_re.match(dir_rel) is not None
+
+    def matches_exclude(self, rel_path: str) -> bool:
+        """Return True if `rel_path` matches any exclude pattern."""
+        return self._exclude_re is not None and self._exclude_re.match(rel_path) is not None
+
+    def matches_include(self, rel_path: str) -> bool:
+        """Return True if `rel_path` matches any include pattern.
+
+        An empty include list matches everything.
+        """
+        return self._include_re is None or self._include_re.match(rel_path) is not None
+
+
+# Parsed include/exclude settings keyed by config path.  Entries are only
+# reused while the file's (mtime_ns, size) signature is unchanged, so edits
+# to reporter_config.json are always picked up.
+_CONFIG_CACHE: Dict[Path, Tuple[Tuple[int, int], "IncludeExcludeConfig"]] = {}
+
 
 @dataclass
 class ReporterConfig:
@@ -121,15 +264,26 @@ class ReporterConfig:
         """
         config_path = base_dir / "reporter_config.json"
         include_exclude: IncludeExcludeConfig
-        if config_path.exists():
-            try:
-                with config_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-                include_exclude = IncludeExcludeConfig(**data.get("include_exclude", {}))
-            except Exception as exc:  # pragma: no cover - user controlled file
-                # If the file cannot be parsed, fall back to defaults and log a warning.
-                print(f"[reporter] Warning: Failed to parse {config_path}: {exc}")
-                include_exclude = IncludeExcludeConfig()
+        # A single stat answers both "does the file exist" and "is the cache
+        # entry still valid"; a missing file simply means defaults.
+        try:
+            st = os.stat(config_path)
+        except OSError:
+            st = None
+        if st is not None:
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = _CONFIG_CACHE.get(config_path)
+            if cached is not None and cached[0] == signature:
+                include_exclude = cached[1]
+            else:
+                try:
+                    data = json.loads(config_path.read_bytes())
+                    include_exclude = IncludeExcludeConfig(**data.get("include_exclude", {}))
+                    _CONFIG_CACHE[config_path] = (signature, include_exclude)
+                except Exception as exc:  # pragma: no cover - user controlled file
+                    # If the file cannot be parsed, fall back to defaults and log a warning.
+                    print(f"[reporter] Warning: Failed to parse {config_path}: {exc}")
+                    include_exclude = IncludeExcludeConfig()
         else:
             include_exclude = IncludeExcludeConfig()
 
@@ -138,5 +292,5 @@ class ReporterConfig:
         return ReporterConfig(
             openai_api_key=api_key,
             include_exclude=include_exclude,
-            reporter_config_path=config_path if config_path.exists() else None,
+            reporter_config_path=config_path if st is not None else None,
         )
\ No newline at end of file
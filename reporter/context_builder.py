@@ -11,26 +11,84 @@ the file contents.
 
 from __future__ import annotations
 
-import fnmatch
+import itertools
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Tuple, Dict, Set
+from typing import Iterable, Iterator, List, Tuple, Dict, Set
 from datetime import datetime
 
 from .config import IncludeExcludeConfig
 
 CONFIG_FILE = "reporter_config.json"
 
+# Stand-in content for files detected as binary by `es_binario`.
+BINARY_PLACEHOLDER = "(Archivo binario, no se muestra el contenido)"
+
+# Thread count for concurrent file reads (I/O bound, so more than the CPU count).
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Markdown fence language by lowercase file extension.
+_LANG_BY_EXT: Dict[str, str] = {
+    "py": "py",
+    "ts": "ts",
+    "tsx": "tsx",
+    "js": "js",
+    "jsx": "jsx",
+    "json": "json",
+    "md": "md",
+    "yml": "yaml",
+    "yaml": "yaml",
+    "toml": "toml",
+    "sh": "sh",
+    "bash": "bash",
+    "ps1": "powershell",
+    "bat": "bat",
+    "ini": "ini",
+    "cfg": "ini",
+    "xml": "xml",
+    "html": "html",
+    "css": "css",
+    "scss": "scss",
+    "less": "less",
+    "java": "java",
+    "kt": "kotlin",
+    "go": "go",
+    "rs": "rust",
+    "c": "c",
+    "h": "c",
+    "cpp": "cpp",
+    "cc": "cpp",
+    "cxx": "cpp",
+    "hpp": "cpp",
+    "m": "objectivec",
+    "mm": "objectivecpp",
+    "swift": "swift",
+    "php": "php",
+    "rb": "ruby",
+    "pl": "perl",
+    "sql": "sql",
+    "proto": "proto",
+}
+
+# Flags for the raw binary sniff (O_BINARY only exists on Windows).
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
 
 def es_binario(file_path: str) -> bool:
+    # Raw fd read: no buffered-reader allocation for a 1 KiB sniff.
+    try:
+        fd = os.open(file_path, _READ_FLAGS)
+    except OSError:
+        return False
     try:
-        with open(file_path, "rb") as file:
-            chunk = file.read(1024)
-            return b"\0" in chunk
-    except Exception:
+        return os.read(fd, 1024).find(b"\0") != -1
+    except OSError:
         return False
+    finally:
+        os.close(fd)
 
 class ContextBuilder:
     """Constructs context for the prompt based on a project directory and configuration."""
@@ -38,6 +96,12 @@ class ContextBuilder:
     def __init__(self, base_dir: Path, config: IncludeExcludeConfig) -> None:
         self.base_dir = base_dir
         self.config = config
+        # Bound once: the config holds the patterns precompiled, so each
+        # check is a single regex match with no per-call lookups.
+        self._exclude_match = config.matches_exclude
+        self._include_match = config.matches_include
+        self._excluded_dir_names = config.excluded_dir_names
+        self._exclude_dir_match = config.matches_exclude_dir if config.has_dir_exclude_globs else None
 
     @dataclass
     class FileEntry:
@@ -55,51 +119,69 @@ class ContextBuilder:
 
     def _is_excluded(self, rel_path: str) -> bool:
         """Return True if the given path (file or directory) matches any exclude pattern."""
-        for pattern in self.config.exclude_patterns:
-            if fnmatch.fnmatch(rel_path, pattern):
-                return True
-        return False
+        return self._exclude_match(rel_path)
 
     def _should_include(self, rel_path: str) -> bool:
         """Return True if the file should be included according to patterns."""
-        # Exclude patterns override include patterns
-        for pattern in self.config.exclude_patterns:
-            if fnmatch.fnmatch(rel_path, pattern):
-                return False
-        # If include_patterns is empty treat as include everything
-        if not self.config.include_patterns:
-            return True
-        for pattern in self.config.include_patterns:
-            if fnmatch.fnmatch(rel_path, pattern):
-                return True
-        return False
+        # Exclude patterns override include patterns; an empty include list
+        # is treated as include everything.
+        return not self._exclude_match(rel_path) and self._include_match(rel_path)
 
     def list_files(self) -> List[str]:
         """Generate a sorted list of relative file paths that are considered for inclusion."""
         files: List[str] = []
-        for root, dirs, filenames in os.walk(self.base_dir, topdown=True):
-            # Compute relative directory in posix style
-            rel_dir = os.path.relpath(root, self.base_dir).replace(os.sep, "/")
-            # Ensure we descend into directories unless they are excluded.
-            # Apply ONLY excludes to dirs, not includes.
-            kept_dirs = []
-            for d in dirs:
-                if rel_dir == ".":
-                    dir_rel = f"{d}/"
-                else:
-                    dir_rel = f"{rel_dir}/{d}/"
-                if not self._is_excluded(dir_rel):
-                    kept_dirs.append(d)
-            dirs[:] = kept_dirs
-            for filename in filenames:
-                rel_path = os.path.relpath(os.path.join(root, filename), self.base_dir)
-                # Normalize Windows style separators to '/' for glob matching
-                rel_norm = rel_path.replace(os.sep, "/")
-                if self._should_include(rel_norm):
-                    files.append(rel_norm)
+        self._scan(self.base_dir, "", files)
         files.sort()
         return files
 
+    def _scan(self, abs_dir: "os.PathLike[str] | str", rel_prefix: str, out: List[str]) -> None:
+        """Append included files below `abs_dir` to `out`.
+
+        `rel_prefix` is the posix-style path of `abs_dir` relative to the
+        base directory ('' at the root, otherwise ending in '/').  Relative
+        paths are built by concatenation and entries are classified from
+        their cached dirent type, so no relpath or extra stat is needed.
+        Like os.walk, symlinked directories are neither descended into nor
+        listed as files, and unreadable directories are skipped.  Pending
+        directories are kept on an explicit stack rather than recursed into,
+        so tree depth is not bounded by the recursion limit; `list_files`
+        sorts the result, so visiting order does not matter.
+        """
+        pending: List[Tuple["os.PathLike[str] | str", str]] = [(abs_dir, rel_prefix)]
+        while pending:
+            abs_dir, rel_prefix = pending.pop()
+            try:
+                with os.scandir(abs_dir) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                name = entry.name
+                rel = rel_prefix + name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    # Exclude patterns override include patterns
+                    if not self._exclude_match(rel) and self._include_match(rel):
+                        out.append(rel)
+                    continue
+                try:
+                    if entry.is_symlink():
+                        continue
+                except OSError:
+                    continue
+                # Ensure we descend into directories unless they are excluded.
+                # Apply ONLY excludes to dirs, not includes.  '**/NAME/**'
+                # excludes are a set lookup on the name; the regex only runs
+                # when some other pattern could match a directory.
+                if rel_prefix and name in self._excluded_dir_names:
+                    continue
+                if self._exclude_dir_match is not None and self._exclude_dir_match(rel + "/"):
+                    continue
+                pending.append((entry.path, rel + "/"))
+
     def build_file_tree_section(self, files: List[str]) -> str:
         """Return a string representation of the project's file tree.
 
@@ -107,109 +189,69 @@ class ContextBuilder:
         and files, with indentation reflecting depth. Only directories
         that are ancestors of the included files are shown.
         """
-        # Derive directories and direct parent relationships
-        dirs: Set[str] = set()
-        dir_files: Dict[str, List[str]] = {}
-        dir_children: Dict[str, Set[str]] = {}
-
-        def parent_dir(path: str) -> str:
-            return path.rsplit("/", 1)[0] if "/" in path else ""
-
-        def base_name(path: str) -> str:
-            return path.rsplit("/", 1)[1] if "/" in path else path
-
-        # Collect files per directory and all ancestor directories
-        for f in files:
-            d = parent_dir(f)
-            dir_files.setdefault(d, []).append(base_name(f))
-            # add ancestors of d
-            if d:
-                parts = d.split("/")
-                for i in range(1, len(parts) + 1):
-                    dirs.add("/".join(parts[:i]))
-        # Build directory children mapping
-        for d in list(dirs):
-            p = parent_dir(d)
-            name = base_name(d)
-            dir_children.setdefault(p, set()).add(name)
-
-        # Ensure root-level files are represented
-        dir_files.setdefault("", [])
-        dir_children.setdefault("", set())
-
-        # Sort helper
-        def render_dir(current: str, depth: int, lines: List[str]) -> None:
-            # Render child directories first
-            children_dirs = sorted(dir_children.get(current, set()))
-            for name in children_dirs:
-                full = f"{current}/{name}" if current else name
-                indent = "  " * depth
-                lines.append(f"{indent}- {name}/")
-                render_dir(full, depth + 1, lines)
-            # Render files in this directory
-            for fname in sorted(dir_files.get(current, [])):
-                indent = "  " * depth
-                lines.append(f"{indent}- {fname}")
+        # Ordering every path by its components, with directory components
+        # ahead of file names, puts each level's subdirectories before its
+        # files.  A single pass then only has to emit the directory
+        # components that differ from the previous file's directory.
+        def tree_key(parts: List[str]) -> List[Tuple[int, str]]:
+            key = [(0, name) for name in parts[:-1]]
+            key.append((1, parts[-1]))
+            return key
 
         lines: List[str] = []
-        # At root: render all top-level directories and files
-        render_dir("", 0, lines)
+        prev_dirs: List[str] = []
+        for parts in sorted((f.split("/") for f in files), key=tree_key):
+            dirs = parts[:-1]
+            common = 0
+            limit = min(len(dirs), len(prev_dirs))
+            while common < limit and dirs[common] == prev_dirs[common]:
+                common += 1
+            for depth in range(common, len(dirs)):
+                lines.append(f"{'  ' * depth}- {dirs[depth]}/")
+            lines.append(f"{'  ' * len(dirs)}- {parts[-1]}")
+            prev_dirs = dirs
         return "\n".join(lines)
 
     def _detect_language(self, rel_path: str) -> str:
         """Infer a language identifier for markdown fences based on extension."""
-        ext = Path(rel_path).suffix.lower().lstrip(".")
-        mapping = {
-            "py": "py",
-            "ts": "ts",
-            "tsx": "tsx",
-            "js": "js",
-            "jsx": "jsx",
-            "json": "json",
-            "md": "md",
-            "yml": "yaml",
-            "yaml": "yaml",
-            "toml": "toml",
-            "sh": "sh",
-            "bash": "bash",
-            "ps1": "powershell",
-            "bat": "bat",
-            "ini": "ini",
-            "cfg": "ini",
-            "xml": "xml",
-            "html": "html",
-            "css": "css",
-            "scss": "scss",
-            "less": "less",
-            "java": "java",
-            "kt": "kotlin",
-            "go": "go",
-            "rs": "rust",
-            "c": "c",
-            "h": "c",
-            "cpp": "cpp",
-            "cc": "cpp",
-            "cxx": "cpp",
-            "hpp": "cpp",
-            "m": "objectivec",
-            "mm": "objectivecpp",
-            "swift": "swift",
-            "php": "php",
-            "rb": "ruby",
-            "pl": "perl",
-            "sql": "sql",
-            "proto": "proto",
-        }
-        return mapping.get(ext, "")
+        # Same rule as Path.suffix: the text after the last dot of the file
+        # name, where a leading dot (".bashrc") does not start an extension.
+        stem, _, ext = rel_path.rpartition("/")[2].rpartition(".")
+        if not stem:
+            return ""
+        return _LANG_BY_EXT.get(ext.lower(), "")
 
     def count_file_lines(self, rel_path: str) -> int:
         """Count the real total number of lines in a file, ignoring any truncation settings."""
         abs_path = self.base_dir / rel_path
+        # Count raw bytes instead of decoding: with universal newlines a line
+        # ends at "\n", "\r\n" or a lone "\r", and a final unterminated line
+        # still counts.
         try:
-            with abs_path.open("r", encoding="utf-8", errors="replace") as f:
-                return sum(1 for _ in f)
-        except Exception:
+            fd = os.open(abs_path, _READ_FLAGS)
+        except OSError:
+            return 0
+        try:
+            total = 0
+            prev_cr = False
+            last = b""
+            while True:
+                buf = os.read(fd, 1 << 20)
+                if not buf:
+                    break
+                total += buf.count(b"\n") + buf.count(b"\r") - buf.count(b"\r\n")
+                if prev_cr and buf[:1] == b"\n":
+                    # "\r\n" split across reads was counted twice.
+                    total -= 1
+                prev_cr = buf[-1:] == b"\r"
+                last = buf[-1:]
+            if last and last not in b"\r\n":
+                total += 1
+            return total
+        except OSError:
             return 0
+        finally:
+            os.close(fd)
 
     def read_files(self, files: List[str]) -> List["ContextBuilder.FileEntry"]:
         """Read the contents of the provided files subject to configured limits.
@@ -220,40 +262,121 @@ class ContextBuilder:
         reading stops when the cumulative length of all included contents exceeds this threshold.
         """
         included: List[ContextBuilder.FileEntry] = []
+        if not files:
+            return included
+        limit = self.config.max_total_characters
         total_chars = 0
-        for rel_path in files:
-            abs_path = self.base_dir / rel_path
-            loc_total = self.count_file_lines(rel_path)
-            language = self._detect_language(rel_path)
+        # Files are read concurrently (the reads release the GIL), while
+        # map() hands the results back in input order so the character
+        # limit is applied exactly as a sequential read would.
+        pool = ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(files)))
+        try:
+            for entry, truncated, counted in pool.map(self._read_one, files):
+                if counted:
+                    # Check cumulative character limit
+                    if limit > 0 and total_chars + len(entry.content) > limit:
+                        # Stop further inclusion and note truncation
+                        break
+                    total_chars += len(entry.content)
+                    if truncated:
+                        entry.content += "\n[...truncated...]\n"
+                included.append(entry)
+        finally:
+            # Reads not yet started are no longer needed once the limit hits.
+            pool.shutdown(wait=True, cancel_futures=True)
+        return included
+
+    def _read_one(self, rel_path: str) -> Tuple["ContextBuilder.FileEntry", bool, bool]:
+        """Read one file for `read_files`.
+
+        Returns `(entry, truncated, counted)`: `entry.content` excludes the
+        truncation marker, and `counted` is False for binaries and read
+        errors, which do not count towards max_total_characters.
+        """
+        abs_path = self.base_dir / rel_path
+        language = self._detect_language(rel_path)
+        if es_binario(str(abs_path)):
+            # Never decode binaries; the placeholder keeps them from eating
+            # into max_total_characters.
+            return ContextBuilder.FileEntry(rel_path, BINARY_PLACEHOLDER, 0, language), False, False
+        max_lines = self.config.max_file_lines
+        try:
+            with abs_path.open("r", encoding="utf-8", errors="ignore") as f:
+                if max_lines > 0:
+                    # Respect max_file_lines: keep only the head and count
+                    # the rest while streaming past it, never holding it.
+                    selected_lines = list(itertools.islice(f, max_lines))
+                    rest = sum(1 for _ in f)
+                else:
+                    selected_lines = f.readlines()
+                    rest = 0
+        except Exception as exc:
+            # If file cannot be read, skip and annotate.
+            return ContextBuilder.FileEntry(rel_path, f"[Error reading file: {exc}]", 0, language), False, False
+        # Same count count_file_lines would give, without a second read.
+        loc_total = len(selected_lines) + rest
+        return ContextBuilder.FileEntry(rel_path, "".join(selected_lines), loc_total, language), rest > 0, True
+
+    @staticmethod
+    def _edit_checklist(items: List[Tuple[int, str, bool]], decisions: Dict[str, bool]) -> bool:
+        """Let the user tick `items` in $VISUAL/$EDITOR in a single round-trip.
+
+        `items` are `(depth, rel_path, is_dir)` in traversal order; boxes start
+        ticked according to `decisions`.  Every listed item ends up in
+        `decisions`, included only when its box is ticked.  Returns False,
+        leaving `decisions` untouched, if the editor could not be run.
+        """
+        # Imported lazily: only needed with --editor, so the default run
+        # does not pay for them at start-up.
+        import shlex
+        import subprocess
+        import tempfile
+
+        lines = [
+            "# Marca con [x] las carpetas y archivos a incluir; [ ] los excluye.",
+            "# El contenido de una carpeta sin marcar se ignora.",
+            "# Las carpetas sin contenido listado (enlaces, excluidas o ya descartadas)",
+            "# se recorren con preguntas Y/N si las marcas.",
+        ]
+        for depth, rel, is_dir in items:
+            key = f"dir::{rel}" if is_dir else f"file::{rel}"
+            mark = "x" if decisions.get(key) else " "
+            lines.append(f"{'  ' * depth}[{mark}] {rel}{'/' if is_dir else ''}")
+        editor = os.environ.get("VISUAL") or os.environ.get("EDITOR") or ("notepad" if os.name == "nt" else "nano")
+        fd, tmp = tempfile.mkstemp(prefix="zoro-", suffix=".txt", text=True)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
             try:
-                with abs_path.open("r", encoding="utf-8", errors="ignore") as f:
-                    lines = f.readlines()
-            except Exception as exc:
-                # If file cannot be read, skip and annotate.
-                included.append(ContextBuilder.FileEntry(rel_path, f"[Error reading file: {exc}]", loc_total, language))
-                continue
-            # Respect max_file_lines
-            if self.config.max_file_lines > 0:
-                selected_lines = lines[: self.config.max_file_lines]
-                truncated = len(lines) > self.config.max_file_lines
+                if subprocess.call(shlex.split(editor, posix=os.name != "nt") + [tmp]) != 0:
+                    return False
+            except OSError:
+                return False
+            with open(tmp, "r", encoding="utf-8") as f:
+                ticked = set()
+                for line in f:
+                    line = line.strip()
+                    if line[:4].lower() == "[x] ":
+                        ticked.add(line[4:])
+        finally:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        for _, rel, is_dir in items:
+            if is_dir:
+                decisions[f"dir::{rel}"] = f"{rel}/" in ticked
             else:
-                selected_lines = lines
-                truncated = False
-            content = "".join(selected_lines)
-            # Check cumulative character limit
-            if self.config.max_total_characters > 0 and total_chars + len(content) > self.config.max_total_characters:
-                # Stop further inclusion and note truncation
-                break
-            total_chars += len(content)
-            if truncated:
-                content += "\n[...truncated...]\n"
-            included.append(ContextBuilder.FileEntry(rel_path, content, loc_total, language))
-        return included
+                decisions[f"file::{rel}"] = rel in ticked
+        return True
 
-    def collect_interactive(self) -> Tuple[str, List["ContextBuilder.FileEntry"]]:
+    def collect_interactive(self, use_editor: bool = False) -> Tuple[str, List["ContextBuilder.FileEntry"]]:
         """Interactively traverse the current working directory to decide which
         directories and files to include. Decisions are persisted in reporter_config.json.
 
+        With `use_editor`, every directory and file is listed once as a
+        checklist in the user's editor instead of being asked about one by one.
+
         Returns:
             Tuple[str, List[FileEntry]]: (structure_markdown, file_entries)
         """
@@ -279,32 +402,91 @@ class ContextBuilder:
                         decisions[k] = v
         # Build structure and content by traversing from CWD
         structure_lines: List[str] = []
-        file_entries: List[ContextBuilder.FileEntry] = []
+        # Files the user accepted, in traversal order; read after traversal.
+        selected_files: List[Tuple[str, str]] = []
 
         def preguntar_inclusion(tipo: str, nombre: str) -> bool:
+            if use_editor and not under_unlisted_dir(nombre):
+                # Only entries that appeared after the checklist was written
+                # get here; they are left out rather than prompted for.
+                # Contents of folders the checklist did not expand, if the
+                # user ticked the folder, are still asked about one by one.
+                return False
             return self._prompt_yes_no(f"¿Deseas incluir {tipo} '{nombre}' (Y/N)? ")
 
-        def norm_rel(p: Path) -> str:
-            # relpath relative to CWD, normalized with forward slashes for consistency
-            return os.path.relpath(str(p)).replace(os.sep, "/")
-
-        def count_lines_abs(p: Path) -> int:
-            try:
-                with p.open("r", encoding="utf-8", errors="replace") as f:
-                    return sum(1 for _ in f)
-            except Exception:
-                return 0
-
-        def traverse(current_dir: Path, depth: int = 0) -> None:
+        def scan_sorted(current_dir: str) -> Tuple[List[os.DirEntry], List[os.DirEntry]]:
+            # One scandir pass classifies every entry from its cached dirent
+            # type; only symlinks need an extra stat to be followed.  Paths
+            # are kept as the plain strings scandir already built.
+            dirs: List[os.DirEntry] = []
+            files: List[os.DirEntry] = []
             try:
-                items = sorted(os.listdir(current_dir))
+                with os.scandir(current_dir) as it:
+                    for entry in sorted(it, key=lambda e: e.name):
+                        try:
+                            if entry.is_dir():
+                                dirs.append(entry)
+                            elif entry.is_file():
+                                files.append(entry)
+                        except OSError:
+                            continue
             except Exception:
-                return
+                pass
+            return dirs, files
+
+        def scan_level(current_dir: str) -> Iterator[Tuple[os.DirEntry, bool]]:
+            dirs, files = scan_sorted(current_dir)
+            return itertools.chain(((e, True) for e in dirs), ((e, False) for e in files))
+
+        def list_all(out: List[Tuple[int, str, bool]]) -> None:
+            # Same order as traverse, using an explicit stack of per-level
+            # iterators.  Symlinked directories (which may loop back up the
+            # tree), directories already declined and well-known excluded
+            # names ('**/NAME/**' patterns, e.g. .git or node_modules) are
+            # listed but not expanded; see `unlisted_dirs`.
+            stack = [(0, "", scan_level(str(scan_root)))]
+            while stack:
+                depth, rel_prefix, level = stack[-1]
+                item = next(level, None)
+                if item is None:
+                    stack.pop()
+                    continue
+                entry, is_dir = item
+                rel = rel_prefix + entry.name
+                out.append((depth, rel, is_dir))
+                if not is_dir:
+                    continue
+                try:
+                    is_link = entry.is_symlink()
+                except OSError:
+                    is_link = True
+                if (
+                    is_link
+                    or decisions.get(f"dir::{rel}") is False
+                    or entry.name in self._excluded_dir_names
+                ):
+                    unlisted_dirs.add(rel)
+                    continue
+                stack.append((depth + 1, rel + "/", scan_level(entry.path)))
+
+        def under_unlisted_dir(rel: str) -> bool:
+            cut = rel.rfind("/")
+            while cut > 0:
+                if rel[:cut] in unlisted_dirs:
+                    return True
+                cut = rel.rfind("/", 0, cut)
+            return False
+
+        # Paths relative to CWD are built by appending names to the parent's
+        # forward-slash prefix, the same string os.path.relpath plus separator
+        # normalization would give, without recomputing it per entry.
+        def traverse(current_dir: str, depth: int = 0, rel_prefix: str = "") -> None:
+            dirs, files = scan_sorted(current_dir)
 
             # First process directories
-            for name in [n for n in items if (current_dir / n).is_dir()]:
-                abs_dir = current_dir / name
-                rel_dir = norm_rel(abs_dir)
+            for entry in dirs:
+                name, abs_dir = entry.name, entry.path
+                rel_dir = rel_prefix + name
                 key = f"dir::{rel_dir}"
                 include = decisions.get(key)
                 if include is None:
@@ -312,12 +494,12 @@ class ContextBuilder:
                     decisions[key] = bool(include)
                 if include:
                     structure_lines.append(f"{'  ' * depth}- {name}/")
-                    traverse(abs_dir, depth + 1)
+                    traverse(abs_dir, depth + 1, rel_dir + "/")
 
             # Then process files
-            for name in [n for n in items if (current_dir / n).is_file()]:
-                abs_file = current_dir / name
-                rel_file = norm_rel(abs_file)
+            for entry in files:
+                name, abs_file = entry.name, entry.path
+                rel_file = rel_prefix + name
                 key = f"file::{rel_file}"
                 include = decisions.get(key)
                 if include is None:
@@ -325,21 +507,45 @@ class ContextBuilder:
                     decisions[key] = bool(include)
                 if include:
                     structure_lines.append(f"{'  ' * depth}- {name}")
-                    # Prepare file entry (no truncation, detect binaries)
-                    language = self._detect_language(rel_file)
-                    if es_binario(str(abs_file)):
-                        content = "(Archivo binario, no se muestra el contenido)"
-                        loc_total = count_lines_abs(abs_file)
-                    else:
-                        try:
-                            with abs_file.open("r", encoding="utf-8", errors="replace") as f:
-                                content = f.read()
-                        except Exception as exc:
-                            content = f"[Error reading file: {exc}]"
-                        loc_total = count_lines_abs(abs_file)
-                    file_entries.append(ContextBuilder.FileEntry(rel_file, content, loc_total, language))
-
-        traverse(scan_root, 0)
+                    selected_files.append((rel_file, abs_file))
+
+        def read_entry(item: Tuple[str, str]) -> "ContextBuilder.FileEntry":
+            # Prepare file entry (no truncation, detect binaries)
+            rel_file, abs_file = item
+            language = self._detect_language(rel_file)
+            if es_binario(abs_file):
+                # Only the 1 KiB sniff is read; line counts are meaningless for binaries.
+                content = BINARY_PLACEHOLDER
+                loc_total = 0
+            else:
+                try:
+                    with open(abs_file, "r", encoding="utf-8", errors="replace") as f:
+                        content = f.read()
+                    # Count lines from the buffer already in memory; a final
+                    # line without a trailing newline still counts.
+                    loc_total = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+                except Exception as exc:
+                    content = f"[Error reading file: {exc}]"
+                    loc_total = 0
+            return ContextBuilder.FileEntry(rel_file, content, loc_total, language)
+
+        # Folders shown in the checklist without their contents.
+        unlisted_dirs: Set[str] = set()
+        if use_editor:
+            items: List[Tuple[int, str, bool]] = []
+            list_all(items)
+            if not self._edit_checklist(items, decisions):
+                # Editor unavailable: fall back to asking item by item.
+                use_editor = False
+
+        traverse(str(scan_root), 0)
+
+        # Read the selected files concurrently; file I/O releases the GIL and
+        # map() keeps the results in traversal order.
+        file_entries: List[ContextBuilder.FileEntry] = []
+        if selected_files:
+            with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(selected_files))) as pool:
+                file_entries = list(pool.map(read_entry, selected_files))
 
         # Persist updated decisions back to reporter_config.json
         # Preserve any non-decision keys (e.g., include_exclude) from existing_data
@@ -353,11 +559,18 @@ class ContextBuilder:
                         new_data[k] = v
         # Add current session decisions
         new_data.update(decisions)
+        # Serialize in one call and swap the file in with os.replace, so an
+        # interrupted run never leaves a truncated config behind.
+        tmp_path = config_path.with_name(config_path.name + ".tmp")
         try:
-            with config_path.open("w", encoding="utf-8") as f:
-                json.dump(new_data, f, indent=2, ensure_ascii=False)
+            with tmp_path.open("w", encoding="utf-8") as f:
+                f.write(json.dumps(new_data, indent=2, ensure_ascii=False))
+            os.replace(tmp_path, config_path)
         except Exception:
             # Silently ignore write errors; interactive choices will be asked again next time
-            pass
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
 
         return ("\n".join(structure_lines).rstrip(), file_entries)
\ No newline at end of file
@@ -15,11 +15,14 @@ the MVP implementation.
 
 from __future__ import annotations
 
+import functools
 import inspect
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .token_cache import TokenCountCache
 
 try:
     import openai  # type: ignore[import]
@@ -34,6 +37,23 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Chunks shorter than this are tokenized directly; hashing and caching them
+# would cost about as much as encoding them.
+_TOKEN_CACHE_MIN_CHARS = 2048
+# Size of the sample encoded to calibrate estimate_tokens_fast; texts up to
+# twice this long are simply encoded in full.
+_CALIBRATION_CHARS = 4096
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model: str) -> Any:
+    """Return the tiktoken encoding for `model`, resolved once per model name."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        # Default to cl100k_base if model unknown
+        return tiktoken.get_encoding("cl100k_base")
+
 
 class OpenAIClient:
     """Wrapper around the OpenAI API with cost estimation and error handling."""
@@ -49,6 +69,8 @@ class OpenAIClient:
                 "The 'openai' package is not installed. Please install it to use API features."
             )
         self.client = openai.OpenAI(api_key=api_key, timeout=2160.0)
+        # Characters per token measured by estimate_tokens_fast (lazily).
+        self._chars_per_token: Optional[float] = None
 
     def estimate_tokens(self, text: str) -> int:
         """Estimate the number of tokens used by a text for the configured model."""
@@ -56,14 +78,54 @@ class OpenAIClient:
         if tiktoken is None:
             # Roughly assume 4 characters per token as a heuristic
             return max(1, len(text) // 4)
-        try:
-            encoding = tiktoken.encoding_for_model(self.model)
-        except Exception:
-            # Default to cl100k_base if model unknown
-            encoding = tiktoken.get_encoding("cl100k_base")
-        tokens = encoding.encode(text)
+        tokens = _get_encoding(self.model).encode(text)
         return len(tokens)
 
+    def estimate_tokens_fast(self, text: str) -> int:
+        """Approximate the token count of `text` without encoding all of it.
+
+        Only a fixed 4 KB window from the middle of the first large text is
+        encoded, to measure this model's characters per token; the ratio is
+        kept on the client and scales the full length.  Meant for log-only
+        estimates: budgeting should keep encoding the full text with
+        `estimate_tokens` or `estimate_tokens_stream`.
+        """
+        if tiktoken is None or len(text) <= 2 * _CALIBRATION_CHARS:
+            return self.estimate_tokens(text)
+        if self._chars_per_token is None:
+            start = (len(text) - _CALIBRATION_CHARS) // 2
+            sample = text[start:start + _CALIBRATION_CHARS]
+            self._chars_per_token = len(sample) / max(1, self.estimate_tokens(sample))
+        return max(1, int(len(text) / self._chars_per_token))
+
+    def estimate_tokens_stream(self, chunks: Iterable[str]) -> int:
+        """Estimate the tokens of the concatenation of `chunks` without joining them.
+
+        Each chunk is tokenized on its own and the counts are summed, which
+        can differ from tokenizing the joined text by a token or so per
+        chunk boundary.  Counts for large chunks are cached on disk by
+        content hash (see `token_cache`), so unchanged file blocks are not
+        re-tokenized on later runs.
+        """
+        if tiktoken is None:
+            # Same 4-characters-per-token heuristic as estimate_tokens
+            return max(1, sum(len(chunk) for chunk in chunks) // 4)
+        encoding = _get_encoding(self.model)
+        cache = TokenCountCache(encoding.name)
+        total = 0
+        for chunk in chunks:
+            if len(chunk) < _TOKEN_CACHE_MIN_CHARS:
+                total += len(encoding.encode(chunk))
+                continue
+            key = cache.key_for(chunk)
+            count = cache.get(key)
+            if count is None:
+                count = len(encoding.encode(chunk))
+                cache.put(key, count)
+            total += count
+        cache.save()
+        return total
+
     def _supports_reasoning(self) -> bool:
         """Heuristic/local whitelist for models that support reasoning effort."""
         m = (self.model or "").lower()
@@ -122,9 +184,21 @@ class OpenAIClient:
         cost_per_output = 0.000015  # 15 USD / 1,000,000 tokens
         return input_tokens * cost_per_input + output_tokens * cost_per_output
 
-    def _poll_until_complete(self, rid: str, timeout_s: float = 2160.0, interval_s: float = 55.0) -> Any:
-        """Poll responses.retrieve(id) until reaching a terminal status or timeout."""
+    def _poll_until_complete(
+        self,
+        rid: str,
+        timeout_s: float = 2160.0,
+        initial_interval_s: float = 0.5,
+        max_interval_s: float = 20.0,
+    ) -> Any:
+        """Poll responses.retrieve(id) until reaching a terminal status or timeout.
+
+        The wait between polls starts short and grows geometrically up to
+        `max_interval_s`, so quick jobs are picked up within a second or
+        two while long ones are not polled more often than needed.
+        """
         deadline = time.time() + timeout_s
+        delay = initial_interval_s
         last = None
         while time.time() < deadline:
             last = self.client.responses.retrieve(rid)
@@ -135,32 +209,40 @@ class OpenAIClient:
             if not self._is_non_terminal(status):
                 # Unknown status → break to avoid infinite loop
                 return last
-            time.sleep(interval_s)
+            time.sleep(max(0.0, min(delay, deadline - time.time())))
+            delay = min(delay * 1.7, max_interval_s)
         return last
 
+    _TEXT_PART_TYPES = frozenset({"output_text", "input_text", "text"})
+
     def _stringify_part(self, part: Any) -> str:
         """Best-effort to normalize content parts to text."""
-        # Attribute-based shapes (SDK objects)
-        try:
-            ptype = getattr(part, "type", None)
-            if ptype in {"output_text", "input_text", "text"}:
-                t = getattr(part, "text", None)
-                if isinstance(t, str):
-                    return t
-                if hasattr(t, "value"):
-                    return str(getattr(t, "value"))
-        except Exception:
-            pass
-        # Dict-like shapes
         if isinstance(part, dict):
-            ptype = part.get("type")
-            if ptype in {"output_text", "input_text", "text"} and "text" in part:
-                if isinstance(part["text"], str):
-                    return part["text"]
-                if isinstance(part["text"], dict) and "value" in part["text"]:
-                    return str(part["text"]["value"])
-            if isinstance(part.get("content"), str):
-                return part["content"]
+            return self._stringify_dict_part(part)
+        return self._stringify_attr_part(part)
+
+    def _stringify_attr_part(self, part: Any) -> str:
+        """Text of an attribute-based (SDK object) content part, or ''."""
+        if getattr(part, "type", None) in self._TEXT_PART_TYPES:
+            t = getattr(part, "text", None)
+            if isinstance(t, str):
+                return t
+            if hasattr(t, "value"):
+                return str(getattr(t, "value"))
+        return ""
+
+    @classmethod
+    def _stringify_dict_part(cls, part: Dict[str, Any]) -> str:
+        """Text of a dict-shaped content part, or ''."""
+        text = part.get("text")
+        if part.get("type") in cls._TEXT_PART_TYPES and "text" in part:
+            if isinstance(text, str):
+                return text
+            if isinstance(text, dict) and "value" in text:
+                return str(text["value"])
+        content = part.get("content")
+        if isinstance(content, str):
+            return content
         return ""
 
     def extract_output_text(self, response: Any) -> str:
@@ -177,11 +259,12 @@ class OpenAIClient:
             out = getattr(response, "output", None)
             if isinstance(out, list) and out:
                 buf: List[str] = []
+                stringify = self._stringify_part
                 for item in out:
                     content = getattr(item, "content", None)
                     if isinstance(content, list):
                         for part in content:
-                            s = self._stringify_part(part)
+                            s = stringify(part)
                             if s:
                                 buf.append(s)
                 txt = "".join(buf).strip()
@@ -211,15 +294,22 @@ class OpenAIClient:
         temperature: float = 0,
         reasoning_effort: Optional[str] = None,
         verbosity: Optional[str] = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         """Call the OpenAI Responses API with the given parameters.
 
         Returns the full response object.  The caller can extract
-        `output_text` from the returned dictionary.
+        `output_text` from the returned dictionary.  With `stream`, the
+        response is received as server-sent events over one connection
+        (see `_stream_response`) instead of being polled for.
         """
         # Estimate cost for budgeting purposes
-        total_input_text = instructions + "\n" + "\n".join(msg["content"] for msg in messages)
-        input_tokens = self.estimate_tokens(total_input_text)
+        # Joined once: used both for the estimate and as the request input
+        joined_input = "\n".join(msg["content"] for msg in messages)
+        total_input_text = instructions + "\n" + joined_input
+        # Logging only (the CLI's input-limit guard uses its own per-chunk
+        # tiktoken estimate), so a sampled estimate is enough here
+        input_tokens = self.estimate_tokens_fast(total_input_text)
         # Roughly estimate output tokens equal to `max_output_tokens` but actual output may be less
         estimated_cost = self.estimate_cost(input_tokens, max_output_tokens)
         logger.info(
@@ -230,7 +320,7 @@ class OpenAIClient:
         kwargs: Dict[str, Any] = {
             "model": self.model,
             "instructions": instructions,
-            "input": "\n".join([msg["content"] for msg in messages]),
+            "input": joined_input,
             "previous_response_id": previous_response_id,
             "tools": tools or [{"type": "web_search"}],
             "max_output_tokens": max_output_tokens,
@@ -264,29 +354,35 @@ class OpenAIClient:
         logger.debug("Final kwargs keys for responses.create: %s", list(kwargs.keys()))
 
         # Perform request, poll if needed, normalize .output_text
+        send = self._stream_response if stream else self.client.responses.create
         try:
-            resp = self.client.responses.create(**kwargs)
-            print(inspect.signature(self.client.responses.create).parameters)
+            resp = send(**kwargs)
         except Exception as e:
             # Retry once without unsupported args if server complains
             msg = str(e)
             if "Unsupported parameter: 'temperature'" in msg and "temperature" in kwargs:
                 logger.info("Retrying without 'temperature' because the model rejected it.")
                 kwargs.pop("temperature", None)
-                resp = self.client.responses.create(**kwargs)
-                print(inspect.signature(self.client.responses.create).parameters)
+                resp = send(**kwargs)
             elif ("Unrecognized request argument: reasoning" in msg or "Unsupported parameter: 'reasoning'" in msg) and "reasoning" in kwargs:
                 logger.info("Retrying without 'reasoning' because the model rejected it.")
                 kwargs.pop("reasoning", None)
-                resp = self.client.responses.create(**kwargs)
-                print(inspect.signature(self.client.responses.create).parameters)
+                resp = send(**kwargs)
             else:
                 raise
+        if logger.isEnabledFor(logging.DEBUG):
+            method = "stream" if stream else "create"
+            logger.debug(
+                "responses.%s params: %s",
+                method,
+                list(inspect.signature(getattr(self.client.responses, method)).parameters),
+            )
 
         status = getattr(resp, "status", None)
         rid = getattr(resp, "id", None)
-        # Some models return non-terminal statuses with empty text → poll
-        if rid and (self._is_non_terminal(status) or not bool(self.extract_output_text(resp))):
+        # Some models return non-terminal statuses with empty text → poll.
+        # A streamed response is already final.
+        if not stream and rid and (self._is_non_terminal(status) or not bool(self.extract_output_text(resp))):
             logger.debug("Initial response status=%s; polling id=%s until completion...", status, rid)
             resp = self._poll_until_complete(rid)
 
@@ -299,6 +395,25 @@ class OpenAIClient:
             pass
         return resp
 
+    def _stream_response(self, **kwargs: Any) -> Any:
+        """Run responses.stream(**kwargs) to completion and return the final response.
+
+        Text deltas are collected as they arrive and used as `output_text`
+        when the final response object carries none.
+        """
+        buf: List[str] = []
+        with self.client.responses.stream(**kwargs) as events:
+            for event in events:
+                if getattr(event, "type", None) == "response.output_text.delta":
+                    buf.append(getattr(event, "delta", "") or "")
+            resp = events.get_final_response()
+        if buf and not self.extract_output_text(resp):
+            try:
+                setattr(resp, "output_text", "".join(buf))
+            except Exception:
+                pass
+        return resp
+
     # Placeholder for Agents API calls; future versions may use this
     def call_agents_api(
         self,
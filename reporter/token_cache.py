@@ -0,0 +1,86 @@
+"""
+Persistent token-count cache for the reporter CLI.
+
+Tokenizing a large prompt with tiktoken is one of the more expensive
+steps of a `--call-api` run, and most of that prompt (the per-file
+blocks) is identical between consecutive runs.  This module stores token
+counts on disk keyed by the SHA-256 of the counted text, so unchanged
+blocks are not re-tokenized.  Because the key is the content itself, no
+explicit invalidation is needed.
+
+The cache is best-effort: any I/O or parse error simply results in an
+empty cache, and failures while saving are ignored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+# Upper bound on stored entries per encoding; the least recently used
+# entries are dropped first when saving.
+MAX_ENTRIES = 50_000
+
+
+def default_cache_dir() -> Path:
+    """Return the directory used for zoro's caches (honors XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "zoro"
+
+
+class TokenCountCache:
+    """Map of text digests to token counts for one tokenizer encoding."""
+
+    def __init__(self, encoding_name: str, cache_dir: Optional[Path] = None) -> None:
+        self.path = (cache_dir or default_cache_dir()) / f"tokens-{encoding_name}.json"
+        self._counts: Dict[str, int] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_bytes())
+            if isinstance(data, dict):
+                self._counts = {k: v for k, v in data.items() if isinstance(v, int)}
+        except Exception:
+            # Missing or corrupt cache file: start empty.
+            self._counts = {}
+
+    @staticmethod
+    def key_for(text: str) -> str:
+        """Return the cache key for `text`."""
+        return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def get(self, key: str) -> Optional[int]:
+        """Return the cached count for `key`, marking it as recently used."""
+        counts = self._counts
+        count = counts.get(key)
+        if count is not None and next(reversed(counts)) != key:
+            # Move to the most-recent end; the new order has to be saved
+            # too, or a later save would evict entries that were just used.
+            del counts[key]
+            counts[key] = count
+            self._dirty = True
+        return count
+
+    def put(self, key: str, count: int) -> None:
+        """Record the token count for `key`."""
+        self._counts[key] = count
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk if anything changed."""
+        if not self._dirty:
+            return
+        counts = self._counts
+        if len(counts) > MAX_ENTRIES:
+            counts = dict(list(counts.items())[-MAX_ENTRIES:])
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps(counts, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except Exception:
+            # Caching is an optimization only; ignore write failures.
+            pass